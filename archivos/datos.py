@@ -63,3 +63,42 @@ class BaseDatos:
             messagebox.showerror("Error de Base de Datos", f"Error obteniendo datos:\n{e}")
             return []
 
+    def iterar_registros(self, consulta, parametros=None, tamano_lote=1000):
+        """
+        Ejecuta una consulta SELECT y genera los registros uno a uno en formato de diccionario.
+        Usa un cursor sin buffer sobre una conexión propia y lee el resultado por lotes con fetchmany,
+        de modo que nunca se carga el resultado completo en memoria.
+        A diferencia de obtener_todos, los errores se propagan para que el llamador no confunda
+        un resultado incompleto con uno terminado.
+        """
+        # Se fuerza el conector en Python puro: con la extensión en C, cerrar la conexión libera el
+        # resultado con mysql_free_result, que lee todas las filas pendientes antes de volver.
+        con = mysql.connector.connect(
+            host=self.host,
+            user=self.usuario,
+            password=self.contrasena,
+            database=self.base,
+            use_pure=True
+        )
+        cursor = con.cursor(dictionary=True, buffered=False)
+        try:
+            cursor.execute(consulta, parametros)
+            while True:
+                lote = cursor.fetchmany(tamano_lote)
+                if not lote:
+                    break
+                for registro in lote:
+                    yield registro
+        finally:
+            # Si el generador se abandona a medias quedan filas sin leer. El conector puro no las
+            # consume al cerrar: el socket se cierra directamente y el servidor aborta la consulta
+            # cuando falla el envío del resto del resultado.
+            try:
+                cursor.close()
+            except Error:
+                pass
+            try:
+                con.close()
+            except Error:
+                pass
+
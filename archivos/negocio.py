@@ -1,6 +1,13 @@
 ##############################
 # CAPA 2: LÓGICA DE NEGOCIO (LogicaNegocio)
 ##############################
+import csv
+import json
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+
 from archivos.datos import BaseDatos
 from mysql.connector import Error
 
@@ -102,3 +109,97 @@ class LogicaNegocio:
         parametros = (mes, anio)
         return self.bd.obtener_todos(consulta, parametros)
 
+    # EXPORTACIÓN DE REPORTES (lectura en streaming)
+    COLUMNAS_DETALLE_VENTAS = ["id_venta", "fecha", "id_detalle", "id_producto", "nombre", "marca",
+                               "cantidad", "precio", "subtotal"]
+
+    def iterar_detalle_ventas_periodo(self, fecha_inicio, fecha_fin):
+        """
+        Genera, línea a línea, el detalle de todas las ventas entre fecha_inicio y fecha_fin (ambas incluidas),
+        junto con los datos de la venta y del producto. No carga el resultado completo en memoria.
+        """
+        consulta = """
+        SELECT v.id_venta, v.fecha, dv.id_detalle, p.id_producto, p.nombre, p.marca,
+               dv.cantidad, p.precio, dv.subtotal
+        FROM ventas v
+        JOIN detalle_venta dv ON v.id_venta = dv.id_venta
+        JOIN productos p ON dv.id_producto = p.id_producto
+        WHERE v.fecha BETWEEN %s AND %s
+        ORDER BY v.fecha, v.id_venta, dv.id_detalle
+        """
+        parametros = (fecha_inicio, fecha_fin)
+        return self.bd.iterar_registros(consulta, parametros)
+
+    def exportar_detalle_ventas_csv(self, ruta, fecha_inicio, fecha_fin, progreso=None, cancelado=None):
+        """
+        Exporta a CSV el detalle de ventas del periodo indicado. Retorna la cantidad de filas escritas,
+        o None si la exportación fue cancelada (en ese caso se elimina el archivo incompleto).
+        """
+        def escribir(archivo, registros):
+            escritor = csv.DictWriter(archivo, fieldnames=self.COLUMNAS_DETALLE_VENTAS)
+            escritor.writeheader()
+            for registro in registros:
+                escritor.writerow(registro)
+                yield
+
+        # Con BOM, para que Excel reconozca el UTF-8 y muestre bien los acentos.
+        return self._exportar(ruta, fecha_inicio, fecha_fin, escribir, progreso, cancelado, codificacion="utf-8-sig")
+
+    def exportar_detalle_ventas_jsonl(self, ruta, fecha_inicio, fecha_fin, progreso=None, cancelado=None):
+        """
+        Exporta a JSON Lines (un objeto JSON por línea) el detalle de ventas del periodo indicado.
+        Retorna la cantidad de filas escritas, o None si la exportación fue cancelada.
+        """
+        def escribir(archivo, registros):
+            for registro in registros:
+                archivo.write(json.dumps(registro, ensure_ascii=False, default=self._serializar_json))
+                archivo.write("\n")
+                yield
+
+        return self._exportar(ruta, fecha_inicio, fecha_fin, escribir, progreso, cancelado)
+
+    def _exportar(self, ruta, fecha_inicio, fecha_fin, escribir, progreso, cancelado, codificacion="utf-8",
+                  cada=1000):
+        """
+        Recorre el detalle de ventas y lo vuelca con la función escribir, que avanza una fila por cada paso.
+        Cada 'cada' filas se informa el avance con progreso(filas) y se consulta cancelado().
+        Se escribe en un archivo temporal junto a ruta, que solo la reemplaza si la exportación termina;
+        ante una cancelación o un error se elimina el temporal y ruta queda intacta.
+        """
+        filas = 0
+        escrito = completado = False
+        registros = self.iterar_detalle_ventas_periodo(fecha_inicio, fecha_fin)
+        temporal = tempfile.NamedTemporaryFile("w", dir=os.path.dirname(os.path.abspath(ruta)), suffix=".tmp",
+                                               newline="", encoding=codificacion, delete=False)
+        try:
+            with temporal as archivo:
+                for _ in escribir(archivo, registros):
+                    filas += 1
+                    if filas % cada == 0:
+                        if progreso:
+                            progreso(filas)
+                        if cancelado and cancelado():
+                            break
+                else:
+                    escrito = True
+            if escrito:
+                os.replace(temporal.name, ruta)
+                completado = True
+        finally:
+            registros.close()
+            if not completado:
+                os.remove(temporal.name)
+        if not completado:
+            return None
+        if progreso:
+            progreso(filas)
+        return filas
+
+    @staticmethod
+    def _serializar_json(valor):
+        """Convierte a texto los tipos devueltos por MySQL que json no sabe serializar."""
+        if isinstance(valor, date):
+            return valor.isoformat()
+        if isinstance(valor, Decimal):
+            return str(valor)
+        raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
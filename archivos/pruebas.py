@@ -1,5 +1,103 @@
+##############################
+# PRUEBAS: EXPORTACIÓN DE REPORTES (sin base de datos)
+##############################
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
 
+from archivos.negocio import LogicaNegocio
 
 
+class BaseDatosFalsa:
+    """Sustituye a BaseDatos: iterar_registros genera los registros dados y anota si el generador se cerró."""
 
+    def __init__(self, registros, error_tras=None):
+        self.registros = registros
+        self.error_tras = error_tras
+        self.cerrado = False
 
+    def iterar_registros(self, consulta, parametros=None, tamano_lote=1000):
+        try:
+            for i, registro in enumerate(self.registros):
+                if i == self.error_tras:
+                    raise RuntimeError("conexión perdida")
+                yield registro
+        finally:
+            self.cerrado = True
+
+
+def registro(n):
+    return {"id_venta": n, "fecha": date(2024, 1, 15), "id_detalle": n, "id_producto": 1, "nombre": "Café",
+            "marca": "Marca", "cantidad": 2, "precio": Decimal("1.50"), "subtotal": Decimal("3.00")}
+
+
+class PruebasExportacion(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "reporte.csv")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def exportar_csv(self, bd, **opciones):
+        logica = LogicaNegocio(bd)
+        return logica.exportar_detalle_ventas_csv(self.ruta, date(2024, 1, 1), date(2024, 3, 31), **opciones)
+
+    def test_periodo_vacio_solo_cabecera(self):
+        self.assertEqual(self.exportar_csv(BaseDatosFalsa([])), 0)
+        with open(self.ruta, "rb") as archivo:
+            self.assertTrue(archivo.read().startswith(b"\xef\xbb\xbf"))
+        with open(self.ruta, encoding="utf-8-sig") as archivo:
+            self.assertEqual(archivo.read().strip(), ",".join(LogicaNegocio.COLUMNAS_DETALLE_VENTAS))
+
+    def test_progreso_cada_mil_filas_y_al_final(self):
+        avances = []
+        filas = self.exportar_csv(BaseDatosFalsa([registro(n) for n in range(2500)]), progreso=avances.append)
+        self.assertEqual(filas, 2500)
+        self.assertEqual(avances, [1000, 2000, 2500])
+
+    def test_cancelar_no_deja_archivo(self):
+        bd = BaseDatosFalsa([registro(n) for n in range(2500)])
+        self.assertIsNone(self.exportar_csv(bd, cancelado=lambda: True))
+        self.assertTrue(bd.cerrado)
+        self.assertEqual(os.listdir(self.directorio.name), [])
+
+    def test_cancelar_conserva_archivo_existente(self):
+        with open(self.ruta, "w") as archivo:
+            archivo.write("anterior")
+        self.assertIsNone(self.exportar_csv(BaseDatosFalsa([registro(n) for n in range(1000)]),
+                                            cancelado=lambda: True))
+        with open(self.ruta) as archivo:
+            self.assertEqual(archivo.read(), "anterior")
+        self.assertEqual(os.listdir(self.directorio.name), ["reporte.csv"])
+
+    def test_error_a_mitad_se_propaga_y_cierra_generador(self):
+        bd = BaseDatosFalsa([registro(n) for n in range(10)], error_tras=5)
+        with self.assertRaises(RuntimeError):
+            self.exportar_csv(bd)
+        self.assertTrue(bd.cerrado)
+        self.assertEqual(os.listdir(self.directorio.name), [])
+
+    def test_jsonl_serializa_decimal_y_fecha(self):
+        ruta = os.path.join(self.directorio.name, "reporte.jsonl")
+        logica = LogicaNegocio(BaseDatosFalsa([registro(1)]))
+        self.assertEqual(logica.exportar_detalle_ventas_jsonl(ruta, date(2024, 1, 1), date(2024, 3, 31)), 1)
+        with open(ruta, encoding="utf-8") as archivo:
+            lineas = archivo.read().splitlines()
+        self.assertEqual(len(lineas), 1)
+        fila = json.loads(lineas[0])
+        self.assertEqual(fila["fecha"], "2024-01-15")
+        self.assertEqual(fila["precio"], "1.50")
+        self.assertEqual(fila["subtotal"], "3.00")
+        self.assertEqual(fila["nombre"], "Café")
+
+    def test_serializar_tipo_desconocido(self):
+        with self.assertRaises(TypeError):
+            LogicaNegocio._serializar_json(object())
+
+
+if __name__ == "__main__":
+    unittest.main()
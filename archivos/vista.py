@@ -1,8 +1,9 @@
 ##############################
 # CAPA 3: PRESENTACIÓN (Interfaz Gráfica con Tkinter)
 ##############################
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from datetime import date
 import matplotlib
 
@@ -357,7 +358,7 @@ class VentanaReportes(tk.Toplevel):
     def __init__(self, maestro, logica: LogicaNegocio):
         super().__init__(maestro)
         self.title("Reporte de Ventas")
-        self.geometry("300x150")  # Ventana para seleccionar mes y año
+        self.geometry("340x330")  # Ventana para seleccionar mes y año, y el periodo a exportar
         self.logica = logica
 
         self.columnconfigure(0, weight=1)
@@ -380,8 +381,43 @@ class VentanaReportes(tk.Toplevel):
         self.combo_anio.grid(row=1, column=1, padx=5, pady=5)
         self.combo_anio.current(0)
 
-        btn_generar = ttk.Button(marco, text="Generar Gráfico", command=self.generar_reporte)
-        btn_generar.grid(row=2, column=0, columnspan=2, padx=10, pady=10)
+        self.btn_generar = ttk.Button(marco, text="Generar Gráfico", command=self.generar_reporte)
+        self.btn_generar.grid(row=2, column=0, columnspan=2, padx=10, pady=10)
+
+        # Exportación del detalle de ventas de un periodo (por defecto, el trimestre en curso)
+        ttk.Separator(marco, orient="horizontal").grid(row=3, column=0, columnspan=2, sticky="EW", pady=5)
+        hoy = date.today()
+        inicio_trimestre = date(hoy.year, 3 * ((hoy.month - 1) // 3) + 1, 1)
+
+        ttk.Label(marco, text="Desde:").grid(row=4, column=0, padx=5, pady=5)
+        self.entry_desde = ttk.Entry(marco, width=12)
+        self.entry_desde.grid(row=4, column=1, padx=5, pady=5)
+        self.entry_desde.insert(0, inicio_trimestre.strftime("%Y-%m-%d"))
+
+        ttk.Label(marco, text="Hasta:").grid(row=5, column=0, padx=5, pady=5)
+        self.entry_hasta = ttk.Entry(marco, width=12)
+        self.entry_hasta.grid(row=5, column=1, padx=5, pady=5)
+        self.entry_hasta.insert(0, hoy.strftime("%Y-%m-%d"))
+
+        self.btn_exportar_csv = ttk.Button(marco, text="Exportar CSV", command=self.exportar_csv)
+        self.btn_exportar_csv.grid(row=6, column=0, padx=5, pady=5)
+        self.btn_exportar_jsonl = ttk.Button(marco, text="Exportar JSONL", command=self.exportar_jsonl)
+        self.btn_exportar_jsonl.grid(row=6, column=1, padx=5, pady=5)
+
+        self.etiqueta_progreso = ttk.Label(marco, text="")
+        self.etiqueta_progreso.grid(row=7, column=0, padx=5, pady=5)
+        self.btn_cancelar = ttk.Button(marco, text="Cancelar", command=self.cancelar_exportacion, state="disabled")
+        self.btn_cancelar.grid(row=7, column=1, padx=5, pady=5)
+
+        # Estado de la exportación en curso, compartido con el hilo que la ejecuta
+        self.hilo_exportacion = None
+        self.exportacion_cancelada = False
+        self.filas_exportadas = 0
+        self.resultado_exportacion = None
+        self.error_exportacion = None
+        self.cerrar_al_terminar = False
+        self.protocol("WM_DELETE_WINDOW", self.cerrar)
+        self.bind("<Destroy>", self.al_destruir)
 
     def generar_reporte(self):
         mes = self.combo_mes.get()
@@ -408,6 +444,94 @@ class VentanaReportes(tk.Toplevel):
         plt.tight_layout()
         plt.show()
 
+    def exportar_csv(self):
+        self.exportar(self.logica.exportar_detalle_ventas_csv, ".csv", [("CSV", "*.csv")])
+
+    def exportar_jsonl(self):
+        self.exportar(self.logica.exportar_detalle_ventas_jsonl, ".jsonl", [("JSON Lines", "*.jsonl")])
+
+    def exportar(self, exportador, extension, tipos):
+        try:
+            desde = date.fromisoformat(self.entry_desde.get().strip())
+            hasta = date.fromisoformat(self.entry_hasta.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", "Las fechas deben tener el formato AAAA-MM-DD.", parent=self)
+            return
+        if desde > hasta:
+            messagebox.showerror("Error", "La fecha 'Desde' no puede ser posterior a 'Hasta'.", parent=self)
+            return
+        ruta = filedialog.asksaveasfilename(parent=self, defaultextension=extension, filetypes=tipos,
+                                            initialfile=f"detalle_ventas_{desde}_{hasta}{extension}")
+        if not ruta:
+            return
+
+        self.exportacion_cancelada = False
+        self.filas_exportadas = 0
+        self.resultado_exportacion = None
+        self.error_exportacion = None
+        self.btn_generar.config(state="disabled")
+        self.btn_exportar_csv.config(state="disabled")
+        self.btn_exportar_jsonl.config(state="disabled")
+        self.btn_cancelar.config(state="normal")
+        self.etiqueta_progreso.config(text="Exportando...")
+        # La exportación corre en otro hilo para no bloquear la ventana; el hilo no toca widgets,
+        # solo actualiza atributos que vigilar_exportacion consulta periódicamente con after().
+        self.hilo_exportacion = threading.Thread(target=self.ejecutar_exportacion,
+                                                 args=(exportador, ruta, desde, hasta))
+        self.hilo_exportacion.start()
+        self.after(100, self.vigilar_exportacion, ruta)
+
+    def ejecutar_exportacion(self, exportador, ruta, desde, hasta):
+        try:
+            self.resultado_exportacion = exportador(ruta, desde, hasta, progreso=self.registrar_progreso,
+                                                    cancelado=lambda: self.exportacion_cancelada)
+        except Exception as e:
+            self.error_exportacion = e
+
+    def registrar_progreso(self, filas):
+        self.filas_exportadas = filas
+
+    def vigilar_exportacion(self, ruta):
+        if self.hilo_exportacion.is_alive():
+            if self.filas_exportadas:
+                self.etiqueta_progreso.config(text=f"{self.filas_exportadas} filas exportadas...")
+            self.after(100, self.vigilar_exportacion, ruta)
+            return
+        self.hilo_exportacion = None
+        if self.cerrar_al_terminar:
+            self.destroy()
+            return
+        self.btn_generar.config(state="normal")
+        self.btn_exportar_csv.config(state="normal")
+        self.btn_exportar_jsonl.config(state="normal")
+        self.btn_cancelar.config(state="disabled")
+        if self.error_exportacion is not None:
+            self.etiqueta_progreso.config(text="Error en la exportación")
+            messagebox.showerror("Error", f"No se pudo exportar el reporte:\n{self.error_exportacion}", parent=self)
+        elif self.resultado_exportacion is None:
+            self.etiqueta_progreso.config(text="Exportación cancelada")
+        else:
+            filas = self.resultado_exportacion
+            self.etiqueta_progreso.config(text=f"{filas} filas exportadas")
+            messagebox.showinfo("Reporte", f"Se exportaron {filas} filas a:\n{ruta}", parent=self)
+
+    def cancelar_exportacion(self):
+        self.exportacion_cancelada = True
+
+    def cerrar(self):
+        # Si hay una exportación en curso se cancela y se oculta la ventana; se destruye cuando el hilo termina.
+        if self.hilo_exportacion:
+            self.exportacion_cancelada = True
+            self.cerrar_al_terminar = True
+            self.withdraw()
+        else:
+            self.destroy()
+
+    def al_destruir(self, evento):
+        # Si la ventana se destruye por otra vía (p. ej. al cerrar la principal), el hilo debe cancelarse igual.
+        if evento.widget is self:
+            self.exportacion_cancelada = True
+
 
 # Ventana para Producto Más Vendido y Producto con Mayores Ingresos
 class VentanaMasVendido(tk.Toplevel):